@@ -2,9 +2,15 @@
 # Created by Renatus Madrigal on 12/26/2025
 #
 
+from article_assistant.agents.batch import run_batch, run_batch_async
+from article_assistant.agents.cache import CachedAgent
 from article_assistant.agents.architect import create_architect_agent, ArchitectDeps
 from article_assistant.agents.stylist import create_stylist_agent
-from article_assistant.agents.scriber import create_scriber_agent, ScriberDeps
+from article_assistant.agents.scriber import (
+    create_scriber_agent,
+    run_scriber_batch,
+    ScriberDeps,
+)
 from article_assistant.agents.reviewer import create_reviewer_agent, ReviewerDeps
 
 __all__ = [
@@ -12,7 +18,11 @@ __all__ = [
     "ArchitectDeps",
     "create_stylist_agent",
     "create_scriber_agent",
+    "run_scriber_batch",
     "ScriberDeps",
     "create_reviewer_agent",
     "ReviewerDeps",
+    "CachedAgent",
+    "run_batch",
+    "run_batch_async",
 ]
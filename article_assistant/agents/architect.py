@@ -4,6 +4,7 @@
 
 from dataclasses import dataclass
 
+import httpx
 from pydantic import BaseModel, Field
 from pydantic_ai import (
     Agent,
@@ -13,8 +14,11 @@ from pydantic_ai import (
     ToolOutput,
     NativeOutput,
 )
+from pydantic_ai.agent import AbstractAgent
 from pydantic_ai.models import Model
 
+from article_assistant.agents.cache import CachedAgent
+from article_assistant.agents.model_client import resolve_model
 from article_assistant.tools import StructureManager
 from article_assistant.types import OutlineItem, Outline
 
@@ -24,32 +28,44 @@ class ArchitectDeps:
     structure_manager: StructureManager
 
 
+_ARCHITECT_PROMPT_TEMPLATE = (
+    "You are an expert article architect. Your role is to design the structure of articles, "
+    "including creating detailed outlines and section plans based on given topics and requirements. "
+    "You are supposed to include introduction as the first and conclusion as the last sections in the outlines you create. "
+    "Utilize the StructureManager to manage and organize article structures effectively."
+    "Ensure all outputs are in {target_language}."
+)
+
+
 def create_architect_agent(
     model: str | Model,
-    additional_tools: list[Tool] = [],
+    additional_tools: list[Tool] | None = None,
     target_language: str = "English",
+    enable_cache: bool = False,
+    http_limits: httpx.Limits | None = None,
+    http_timeout: float | None = None,
     **kwargs,
-) -> Agent[ArchitectDeps, Outline]:
+) -> AbstractAgent[ArchitectDeps, Outline]:
     """
     Creates an Architect agent with the necessary tools.
     Args:
         model (str | Model): The language model to use for the agent.
-        additional_tools (list[Tool]): Additional tools to include in the agent.
+        additional_tools (list[Tool] | None): Additional tools to include in the agent.
+        enable_cache (bool): Whether to reuse the results of identical runs.
+        http_limits (httpx.Limits | None): Connection pool limits used when `model` is a name.
+        http_timeout (float | None): HTTP timeout in seconds used when `model` is a name.
+            The model is only rebuilt when `http_limits` or `http_timeout` is given.
     Returns:
         Agent: The created Architect agent.
     """
-    system_prompt = (
-        "You are an expert article architect. Your role is to design the structure of articles, "
-        "including creating detailed outlines and section plans based on given topics and requirements. "
-        "You are supposed to include introduction as the first and conclusion as the last sections in the outlines you create. "
-        "Utilize the StructureManager to manage and organize article structures effectively."
-        f"Ensure all outputs are in {target_language}."
-    )
-    return Agent(
+    model = resolve_model(model, http_limits, http_timeout)
+    system_prompt = _ARCHITECT_PROMPT_TEMPLATE.format(target_language=target_language)
+    agent = Agent(
         model,
         deps_type=ArchitectDeps,
-        tools=additional_tools,
+        tools=additional_tools or [],
         system_prompt=system_prompt,
         output_type=Outline,
         **kwargs,
     )
+    return CachedAgent(agent) if enable_cache else agent
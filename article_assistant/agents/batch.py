@@ -0,0 +1,57 @@
+#
+# Created by Renatus Madrigal on 10/15/2026
+#
+
+import asyncio
+from collections.abc import Sequence
+from typing import Any
+
+from pydantic_ai import AgentRunResult
+from pydantic_ai.agent import AbstractAgent
+from pydantic_ai.output import OutputDataT
+from pydantic_ai.tools import AgentDepsT
+
+
+async def run_batch_async(
+    agent: AbstractAgent[AgentDepsT, OutputDataT],
+    prompts: Sequence[str],
+    deps: AgentDepsT = None,
+    max_concurrency: int = 16,
+    **kwargs: Any,
+) -> list[AgentRunResult[OutputDataT]]:
+    """
+    Runs an agent on several prompts concurrently.
+
+    Args:
+        agent (AbstractAgent): The agent to run.
+        prompts (Sequence[str]): The user prompts, one run per prompt.
+        deps: The dependencies shared by all runs.
+        max_concurrency (int): The maximum number of runs in flight at once.
+        **kwargs: Additional keyword arguments passed to each `agent.run` call.
+    Returns:
+        list[AgentRunResult]: The run results, in the order of `prompts`.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run_one(prompt: str) -> AgentRunResult[OutputDataT]:
+        async with semaphore:
+            return await agent.run(prompt, deps=deps, **kwargs)
+
+    return await asyncio.gather(*(run_one(prompt) for prompt in prompts))
+
+
+def run_batch(
+    agent: AbstractAgent[AgentDepsT, OutputDataT],
+    prompts: Sequence[str],
+    deps: AgentDepsT = None,
+    max_concurrency: int = 16,
+    **kwargs: Any,
+) -> list[AgentRunResult[OutputDataT]]:
+    """
+    Synchronous wrapper around `run_batch_async`.
+
+    Must not be called from a running event loop.
+    """
+    return asyncio.run(
+        run_batch_async(agent, prompts, deps, max_concurrency=max_concurrency, **kwargs)
+    )
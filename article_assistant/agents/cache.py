@@ -0,0 +1,115 @@
+#
+# Created by Renatus Madrigal on 10/15/2026
+#
+
+import copy
+import hashlib
+import json
+from collections import OrderedDict
+from typing import Any
+
+from loguru import logger
+from pydantic_ai import AgentRunResult
+from pydantic_ai.agent import WrapperAgent
+from pydantic_ai.messages import ModelMessagesTypeAdapter
+from pydantic_ai.output import OutputDataT
+from pydantic_ai.tools import AgentDepsT
+
+_CACHE_SIZE = 256
+_result_cache: OrderedDict[str, AgentRunResult[Any]] = OrderedDict()
+_AGENT_INTERNALS = (
+    "_system_prompts",
+    "_system_prompt_functions",
+    "_instructions",
+    "_function_toolset",
+    "_user_toolsets",
+)
+
+
+class CachedAgent(WrapperAgent[AgentDepsT, OutputDataT]):
+    """
+    Wraps an agent and reuses the results of previous runs with identical inputs.
+
+    Runs are keyed on the model, system prompts, instructions, tools, toolsets,
+    user prompt, message history, model settings and output type. Runs that pass
+    deps, instructions or toolsets, and agents with dynamic system prompts or
+    instructions, are not cached, since their results depend on state outside
+    the key. The cache is shared by all cached
+    agents in the process. Side effects of tool calls on the run dependencies are
+    not replayed on a cache hit.
+    """
+
+    async def run(self, user_prompt: Any = None, **kwargs: Any) -> AgentRunResult[Any]:
+        key = self._cache_key(user_prompt, kwargs)
+        if key is None:
+            return await self.wrapped.run(user_prompt, **kwargs)
+
+        if key in _result_cache:
+            logger.debug("Reusing cached result for agent {}.", self.name)
+            _result_cache.move_to_end(key)
+            return copy.deepcopy(_result_cache[key])
+
+        result = await self.wrapped.run(user_prompt, **kwargs)
+        _result_cache[key] = copy.deepcopy(result)
+        if len(_result_cache) > _CACHE_SIZE:
+            _result_cache.popitem(last=False)
+        return result
+
+    def _cache_key(self, user_prompt: Any, kwargs: dict[str, Any]) -> str | None:
+        if not isinstance(user_prompt, str) or any(
+            kwargs.get(name) is not None
+            for name in (
+                "deps",
+                "instructions",
+                "toolsets",
+                "deferred_tool_results",
+                "event_stream_handler",
+            )
+        ):
+            return None
+
+        # The key is built from the agent's internals; an agent that does not expose
+        # all of them cannot be told apart from others and is never cached.
+        internals = [getattr(self.wrapped, name, None) for name in _AGENT_INTERNALS]
+        if any(value is None for value in internals):
+            return None
+        (
+            system_prompts,
+            system_prompt_functions,
+            instructions,
+            function_toolset,
+            user_toolsets,
+        ) = internals
+        # Dynamic system prompts and instructions depend on the run context.
+        if system_prompt_functions or any(
+            not isinstance(part, str) for part in instructions
+        ):
+            return None
+        tool_names = sorted(function_toolset.tools)
+        toolsets = [
+            f"{type(toolset).__qualname__}:{toolset.id}:{id(toolset)}"
+            for toolset in user_toolsets
+        ]
+
+        model = kwargs.get("model") or self.wrapped.model
+        if model is not None and not isinstance(model, str):
+            model = f"{model.system}:{model.model_name}"
+        output_type = kwargs.get("output_type") or self.wrapped.output_type
+
+        digest = hashlib.blake2b(digest_size=16)
+        for part in (
+            str(model),
+            "\0".join(system_prompts),
+            "\0".join(instructions),
+            "\0".join(tool_names),
+            "\0".join(toolsets),
+            user_prompt,
+            json.dumps(kwargs.get("model_settings"), sort_keys=True, default=repr),
+            repr(output_type),
+        ):
+            digest.update(part.encode())
+            digest.update(b"\0")
+        digest.update(
+            ModelMessagesTypeAdapter.dump_json(kwargs.get("message_history") or [])
+        )
+        return digest.hexdigest()
@@ -0,0 +1,118 @@
+#
+# Created by Renatus Madrigal on 10/15/2026
+#
+
+import inspect
+from functools import lru_cache
+from typing import Any
+
+import httpx
+from pydantic_ai.models import Model, get_user_agent, infer_model
+from pydantic_ai.providers import Provider, infer_provider, infer_provider_class
+
+DEFAULT_HTTP_LIMITS = httpx.Limits(max_connections=1000, max_keepalive_connections=500)
+
+
+def create_http_client(
+    limits: httpx.Limits | None = None, timeout: float | None = None
+) -> httpx.AsyncClient:
+    """
+    Creates an HTTP client for model providers with the given pool limits.
+
+    Apart from the limits and the timeout, the client matches the one pydantic-ai
+    creates for providers by default, including its User-Agent header.
+
+    Args:
+        limits (httpx.Limits | None): The connection pool limits to use.
+            Defaults to DEFAULT_HTTP_LIMITS.
+        timeout (float | None): The timeout in seconds for HTTP requests.
+            Defaults to pydantic-ai's 600 seconds, with a 5 second connect timeout.
+    Returns:
+        httpx.AsyncClient: The HTTP client.
+    """
+    return httpx.AsyncClient(
+        limits=limits or DEFAULT_HTTP_LIMITS,
+        timeout=(
+            httpx.Timeout(timeout=600, connect=5)
+            if timeout is None
+            else httpx.Timeout(timeout)
+        ),
+        headers={"User-Agent": get_user_agent()},
+    )
+
+
+def resolve_model(
+    model: str | Model,
+    http_limits: httpx.Limits | None = None,
+    http_timeout: float | None = None,
+) -> str | Model:
+    """
+    Resolves a model name into a model whose HTTP client uses the given settings.
+
+    Model instances, and model names given without HTTP settings, are returned
+    unchanged, so the agent still infers the model lazily. Models built from the
+    same name and settings share a single HTTP client, so concurrent agents draw
+    from one connection pool instead of the provider default of 100 connections.
+
+    Args:
+        model (str | Model): The model name or model instance.
+        http_limits (httpx.Limits | None): The connection pool limits to use.
+            Defaults to DEFAULT_HTTP_LIMITS.
+        http_timeout (float | None): The timeout in seconds for HTTP requests.
+            Defaults to the pydantic-ai provider timeouts.
+    Returns:
+        str | Model: The resolved model.
+    """
+    if isinstance(model, Model) or (http_limits is None and http_timeout is None):
+        return model
+    limits = http_limits or DEFAULT_HTTP_LIMITS
+    return _build_model(
+        model,
+        limits.max_connections,
+        limits.max_keepalive_connections,
+        limits.keepalive_expiry,
+        http_timeout,
+    )
+
+
+@lru_cache(maxsize=None)
+def _build_model(
+    model_name: str,
+    max_connections: int | None,
+    max_keepalive_connections: int | None,
+    keepalive_expiry: float | None,
+    timeout: float | None,
+) -> Model:
+    http_client = create_http_client(
+        httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        ),
+        timeout,
+    )
+
+    def provider_factory(provider_name: str) -> Provider[Any]:
+        provider = _provider_with_client(provider_name, http_client)
+        return provider if provider is not None else infer_provider(provider_name)
+
+    return infer_model(model_name, provider_factory=provider_factory)
+
+
+def _provider_with_client(
+    provider_name: str, http_client: httpx.AsyncClient
+) -> Provider[Any] | None:
+    # Returns None when the provider cannot be built from the client alone: it
+    # has no provider class, its class takes no `http_client`, it rejects this
+    # client, or it needs more arguments to become the requested provider.
+    try:
+        provider_class = infer_provider_class(provider_name)
+    except ValueError:
+        return None
+    if "http_client" not in inspect.signature(provider_class).parameters:
+        return None
+    try:
+        provider = provider_class(http_client=http_client)
+    except TypeError:
+        return None
+    return provider if provider.name == provider_name else None
@@ -4,9 +4,13 @@
 
 from dataclasses import dataclass
 
+import httpx
 from pydantic_ai import Agent, Tool
+from pydantic_ai.agent import AbstractAgent
 from pydantic_ai.models import Model
 
+from article_assistant.agents.cache import CachedAgent
+from article_assistant.agents.model_client import resolve_model
 from article_assistant.tools import KnowledgeBase, StructureManager, StyleManager
 
 
@@ -17,33 +21,44 @@ class ReviewerDeps:
     knowledge_base: KnowledgeBase
 
 
+_REVIEWER_PROMPT = (
+    "You are an expert article reviewer. Your role is to review and make modifications on article sections "
+    "based on the provided outlines, style guides, and knowledge base. "
+    "You are also supposed to create a title and keywords for the article based on the content. "
+    "Utilize the StyleManager, KnowledgeBase, StructureManager and any other tools to ensure the content is "
+    "well-structured, stylistically consistent, and factually accurate. "
+)
+
+
 def create_reviewer_agent(
     model: str | Model,
-    additional_tools: list[Tool] = [],
+    additional_tools: list[Tool] | None = None,
+    enable_cache: bool = False,
+    http_limits: httpx.Limits | None = None,
+    http_timeout: float | None = None,
     **kwargs,
-) -> Agent[ReviewerDeps, str]:
+) -> AbstractAgent[ReviewerDeps, str]:
     """
     Creates a Reviewer agent with the necessary tools.
     Args:
         model (str | Model): The language model to use for the agent.
-        additional_tools (list[Tool]): Additional tools to include in the agent.
+        additional_tools (list[Tool] | None): Additional tools to include in the agent.
+        enable_cache (bool): Whether to reuse the results of identical runs.
+        http_limits (httpx.Limits | None): Connection pool limits used when `model` is a name.
+        http_timeout (float | None): HTTP timeout in seconds used when `model` is a name.
+            The model is only rebuilt when `http_limits` or `http_timeout` is given.
     Returns:
         Agent: The created Reviewer agent.
     """
-    tools = (
-        additional_tools
-        + KnowledgeBase.get_tools(attr_name="knowledge_base")
-        + StyleManager.get_tools(attr_name="style_manager")
-        + StructureManager.get_tools(attr_name="structure_manager")
-    )
-    system_prompt = (
-        "You are an expert article reviewer. Your role is to review and make modifications on article sections "
-        "based on the provided outlines, style guides, and knowledge base. "
-        "You are also supposed to create a title and keywords for the article based on the content. "
-        "Utilize the StyleManager, KnowledgeBase, StructureManager and any other tools to ensure the content is "
-        "well-structured, stylistically consistent, and factually accurate. "
-    )
-    return Agent(
+    model = resolve_model(model, http_limits, http_timeout)
+    tools = [
+        *(additional_tools or ()),
+        *KnowledgeBase.get_tools(attr_name="knowledge_base"),
+        *StyleManager.get_tools(attr_name="style_manager"),
+        *StructureManager.get_tools(attr_name="structure_manager"),
+    ]
+    system_prompt = _REVIEWER_PROMPT
+    agent = Agent(
         model,
         deps_type=ReviewerDeps,
         tools=tools,
@@ -51,3 +66,4 @@ def create_reviewer_agent(
         output_type=str,
         **kwargs,
     )
+    return CachedAgent(agent) if enable_cache else agent
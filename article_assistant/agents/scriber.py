@@ -2,17 +2,22 @@
 # Created by Renatus Madrigal on 12/26/2025
 #
 
+import httpx
 from pydantic import BaseModel, Field
 from pydantic_ai import (
     Agent,
     Tool,
     PromptedOutput,
 )
+from pydantic_ai.agent import AbstractAgent
 from pydantic_ai.models import Model
+from article_assistant.agents.batch import run_batch_async
+from article_assistant.agents.cache import CachedAgent
+from article_assistant.agents.model_client import resolve_model
 from article_assistant.tools import StyleManager, KnowledgeBase, StructureManager
 from article_assistant.types import StyleGuide, OutlineItem, Outline, SectionInfo
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
 
 @dataclass
@@ -22,36 +27,54 @@ class ScriberDeps:
     structure_manager: StructureManager
 
 
+_SCRIBER_PROMPT = (
+    "You are an expert article scriber. Your role is to write detailed sections of articles "
+    "based on the provided outlines, style guides, and knowledge base. "
+    "Utilize the StyleManager, KnowledgeBase, StructureManager and any other tools to ensure the content is "
+    "well-structured, stylistically consistent, and factually accurate. "
+    "You are not supposed to add a heading line in the contents you write. "
+    "The sub-headings should start from H3. "
+    "You are allowed to slightly change your writing style with a little mismatch to the style guide "
+    "to make your writing more human-like and less AI-generated, but do not deviate too much from the style guide."
+)
+
+_SECTION_PROMPT = (
+    "Write a detailed section for the outline item titled '{title}'. "
+    "Use the purpose '{purpose}' to guide the content. "
+    "Refer to the style guide and knowledge base as needed. "
+    "Ensure the content is in {target_language}."
+)
+
+
 def create_scriber_agent(
     model: str | Model,
-    additional_tools: list[Tool] = [],
+    additional_tools: list[Tool] | None = None,
+    enable_cache: bool = False,
+    http_limits: httpx.Limits | None = None,
+    http_timeout: float | None = None,
     **kwargs,
-) -> Agent[ScriberDeps, SectionInfo]:
+) -> AbstractAgent[ScriberDeps, SectionInfo]:
     """
     Creates a Scriber agent with the necessary tools.
     Args:
         model (str | Model): The language model to use for the agent.
-        tools (list[Tool]): Additional tools to include in the agent.
+        additional_tools (list[Tool] | None): Additional tools to include in the agent.
+        enable_cache (bool): Whether to reuse the results of identical runs.
+        http_limits (httpx.Limits | None): Connection pool limits used when `model` is a name.
+        http_timeout (float | None): HTTP timeout in seconds used when `model` is a name.
+            The model is only rebuilt when `http_limits` or `http_timeout` is given.
     Returns:
         Agent: The created Scriber agent.
     """
-    tools = (
-        additional_tools
-        + KnowledgeBase.get_tools(attr_name="knowledge_base")
-        + StyleManager.get_tools(attr_name="style_manager")
-        + StructureManager.get_tools(attr_name="structure_manager")
-    )
-    system_prompt = (
-        "You are an expert article scriber. Your role is to write detailed sections of articles "
-        "based on the provided outlines, style guides, and knowledge base. "
-        "Utilize the StyleManager, KnowledgeBase, StructureManager and any other tools to ensure the content is "
-        "well-structured, stylistically consistent, and factually accurate. "
-        "You are not supposed to add a heading line in the contents you write. "
-        "The sub-headings should start from H3. "
-        "You are allowed to slightly change your writing style with a little mismatch to the style guide "
-        "to make your writing more human-like and less AI-generated, but do not deviate too much from the style guide."
-    )
-    return Agent(
+    model = resolve_model(model, http_limits, http_timeout)
+    tools = [
+        *(additional_tools or ()),
+        *KnowledgeBase.get_tools(attr_name="knowledge_base"),
+        *StyleManager.get_tools(attr_name="style_manager"),
+        *StructureManager.get_tools(attr_name="structure_manager"),
+    ]
+    system_prompt = _SCRIBER_PROMPT
+    agent = Agent(
         model,
         deps_type=ScriberDeps,
         tools=tools,
@@ -59,3 +82,61 @@ def create_scriber_agent(
         output_type=SectionInfo,
         **kwargs,
     )
+    return CachedAgent(agent) if enable_cache else agent
+
+
+def section_prompt(outline_item: OutlineItem, target_language: str) -> str:
+    """
+    Builds the Scriber prompt for writing a single outline item.
+
+    Args:
+        outline_item (OutlineItem): The outline item to write.
+        target_language (str): The language the section should be written in.
+    Returns:
+        str: The prompt for the Scriber agent.
+    """
+    return _SECTION_PROMPT.format(
+        title=outline_item.title,
+        purpose=outline_item.purpose,
+        target_language=target_language,
+    )
+
+
+async def run_scriber_batch(
+    scriber: AbstractAgent[ScriberDeps, SectionInfo],
+    deps: ScriberDeps,
+    indices: list[int],
+    target_language: str = "English",
+    concurrency: int = 8,
+) -> list[SectionInfo]:
+    """
+    Writes the sections for several outline items concurrently.
+
+    At most `concurrency` Scriber runs are in flight at once. Each returned section
+    carries the outline index it was written for, and the list follows the order of
+    `indices`. The runs work on a snapshot of the StructureManager, so sections they
+    add through tools never reach `deps.structure_manager`; adding the returned
+    sections to it is left to the caller.
+
+    Args:
+        scriber (AbstractAgent[ScriberDeps, SectionInfo]): The Scriber agent.
+        deps (ScriberDeps): The dependencies shared by all Scriber runs.
+        indices (list[int]): The outline indices of the sections to write.
+        target_language (str): The language the sections should be written in.
+        concurrency (int): The maximum number of concurrent Scriber runs.
+    Returns:
+        list[SectionInfo]: The written sections.
+    """
+    prompts = [
+        section_prompt(deps.structure_manager.get_section_plan(index), target_language)
+        for index in indices
+    ]
+    snapshot_deps = replace(deps, structure_manager=deps.structure_manager.snapshot())
+    results = await run_batch_async(
+        scriber, prompts, deps=snapshot_deps, max_concurrency=concurrency
+    )
+    sections = []
+    for index, result in zip(indices, results):
+        result.output.section_index = index
+        sections.append(result.output)
+    return sections
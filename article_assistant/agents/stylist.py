@@ -2,37 +2,54 @@
 # Created by Renatus Madrigal on 12/26/2025
 #
 
+from article_assistant.agents.cache import CachedAgent
+from article_assistant.agents.model_client import resolve_model
 from article_assistant.types import StyleGuide
+import httpx
 from pydantic_ai import Agent, Tool, PromptedOutput
+from pydantic_ai.agent import AbstractAgent
 from pydantic_ai.models import Model
 
+_STYLE_GUIDE_OUTPUT = PromptedOutput(
+    [StyleGuide], name="StyleGuide", description="The article style guide"
+)
+
+_STYLIST_PROMPT_TEMPLATE = (
+    "You are an expert article stylist. Your role is to define and manage the style of articles, "
+    "including setting tone, voice, and target audience based on given requirements. "
+    "Ensure all outputs are in {target_language}."
+)
+
 
 def create_stylist_agent(
     model: str | Model,
-    additional_tools: list[Tool] = [],
+    additional_tools: list[Tool] | None = None,
     target_language: str = "English",
+    enable_cache: bool = False,
+    http_limits: httpx.Limits | None = None,
+    http_timeout: float | None = None,
     **kwargs,
-) -> Agent[None, StyleGuide]:
+) -> AbstractAgent[None, StyleGuide]:
     """
     Creates a Stylist agent with the necessary tools.
     Args:
         model (str | Model): The language model to use for the agent.
-        additional_tools (list[Tool]): Additional tools to include in the agent.
+        additional_tools (list[Tool] | None): Additional tools to include in the agent.
+        enable_cache (bool): Whether to reuse the results of identical runs.
+        http_limits (httpx.Limits | None): Connection pool limits used when `model` is a name.
+        http_timeout (float | None): HTTP timeout in seconds used when `model` is a name.
+            The model is only rebuilt when `http_limits` or `http_timeout` is given.
     Returns:
         Agent: The created Stylist agent.
     """
+    model = resolve_model(model, http_limits, http_timeout)
     # TODO: Human-in-the-loop for style decisions
-    system_prompt = (
-        "You are an expert article stylist. Your role is to define and manage the style of articles, "
-        "including setting tone, voice, and target audience based on given requirements. "
-        f"Ensure all outputs are in {target_language}."
-    )
-    return Agent(
+    system_prompt = _STYLIST_PROMPT_TEMPLATE.format(target_language=target_language)
+    agent = Agent(
         model,
-        tools=additional_tools,
+        tools=additional_tools or [],
         system_prompt=system_prompt,
-        output_type=PromptedOutput(
-            [StyleGuide], name="StyleGuide", description="The article style guide"
-        ),
+        output_type=_STYLE_GUIDE_OUTPUT,
         **kwargs,
     )
+    return CachedAgent(agent) if enable_cache else agent
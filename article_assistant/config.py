@@ -2,7 +2,7 @@
 # Created by Renatus Madrigal on 12/26/2025
 #
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, SecretStr
 
 
 class LLMConfig(BaseModel):
@@ -10,7 +10,7 @@ class LLMConfig(BaseModel):
         ...,
         description="The name of the language model to use.",
     )
-    api_key: str = Field(
+    api_key: SecretStr = Field(
         ...,
         description="The API key for accessing the language model service.",
     )
@@ -2,9 +2,14 @@
 # Created by Renatus Madrigal on 12/28/2025
 #
 
+from datetime import date, datetime
+from functools import lru_cache
+
 from pydantic_ai import Tool
 from loguru import logger
 
+from article_assistant.utils.tool_binding import copy_tools
+
 
 def current_date() -> str:
     """
@@ -13,11 +18,14 @@ def current_date() -> str:
     Returns:
         str: The current date in YYYY-MM-DD format.
     """
-    from datetime import datetime
-
     logger.trace("Fetching current date.")
 
-    return datetime.now().strftime("%Y-%m-%d")
+    return _today_str(datetime.now().toordinal())
+
+
+@lru_cache(maxsize=1)
+def _today_str(day_ordinal: int) -> str:
+    return date.fromordinal(day_ordinal).strftime("%Y-%m-%d")
 
 
 def get_base_tools() -> list[Tool]:
@@ -27,11 +35,16 @@ def get_base_tools() -> list[Tool]:
     Returns:
         list[Tool]: A list of base tools.
     """
-    return [
+    return copy_tools(_build_tools())
+
+
+@lru_cache(maxsize=1)
+def _build_tools() -> tuple[Tool, ...]:
+    return (
         Tool(
             current_date,
             name="current_date",
             description="Get the current date.",
             takes_ctx=False,
-        )
-    ]
+        ),
+    )
@@ -2,21 +2,79 @@
 # Created by Renatus Madrigal on 12/26/2025
 #
 
-from typing import Any
+import os
+import tempfile
+from pathlib import Path
 
 from loguru import logger
-from pydantic import BaseModel, Field
-from pydantic_ai import RunContext, Tool
+from pydantic import BaseModel, Field, PrivateAttr, model_validator
+from pydantic_ai import Tool
 
 from article_assistant.types import ConceptInfo
+from article_assistant.utils.locks import InstanceLock
+from article_assistant.utils.tool_binding import build_method_tools
 
 
 class KnowledgeBase(BaseModel):
     concepts: list[ConceptInfo] = Field(
-        default=[],
+        default_factory=list,
         description="A list of concepts stored in the knowledge base.",
     )
 
+    _by_name: dict[str, ConceptInfo] = PrivateAttr(default_factory=dict)
+    # The JSON file the knowledge base is saved to after each change.
+    _persist_path: Path | None = PrivateAttr(default=None)
+    # Sync tools run in worker threads, so additions and saves are serialized with
+    # this lock.
+    _lock: InstanceLock = PrivateAttr(default_factory=InstanceLock)
+
+    @model_validator(mode="after")
+    def _index_concepts(self) -> "KnowledgeBase":
+        self._by_name = {}
+        for concept in self.concepts:
+            self._by_name.setdefault(concept.name, concept)
+        return self
+
+    @classmethod
+    def load_or_create(cls, path: str | Path) -> "KnowledgeBase":
+        """
+        Loads a knowledge base from a JSON file, or creates an empty one if the file
+        does not exist. The returned knowledge base is saved back to the same file
+        whenever a concept is added.
+
+        Args:
+            path (str | Path): The JSON file to load from and save to.
+        Returns:
+            KnowledgeBase: The loaded or newly created knowledge base.
+        """
+        path = Path(path)
+        if path.exists():
+            logger.info("Loading knowledge base from {}", path)
+            kb = cls.model_validate_json(path.read_bytes())
+        else:
+            kb = cls()
+        kb._persist_path = path
+        return kb
+
+    def save(self, path: str | Path) -> None:
+        """
+        Atomically writes the knowledge base to a JSON file.
+
+        Args:
+            path (str | Path): The file to write to.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(self.model_dump_json().encode())
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+
     def add_concept(self, concept: ConceptInfo) -> None:
         """
         Adds a new concept to the knowledge base.
@@ -24,8 +82,12 @@ class KnowledgeBase(BaseModel):
         Args:
             concept (ConceptInfo): The concept to add.
         """
-        logger.info(f"Adding new concept: {concept}")
-        self.concepts.append(concept)
+        logger.info("Adding new concept: {}", concept)
+        with self._lock:
+            self.concepts.append(concept)
+            self._by_name.setdefault(concept.name, concept)
+            if self._persist_path is not None:
+                self.save(self._persist_path)
 
     def get_concept(self, name: str) -> ConceptInfo | None:
         """
@@ -36,11 +98,8 @@ class KnowledgeBase(BaseModel):
         Returns:
             ConceptInfo | None: The concept if found, else None.
         """
-        logger.info(f"Retrieving concept by name: {name}")
-        for concept in self.concepts:
-            if concept.name == name:
-                return concept
-        return None
+        logger.debug("Retrieving concept by name: {}", name)
+        return self._by_name.get(name)
 
     def list_concepts(self) -> list[str]:
         """
@@ -49,8 +108,8 @@ class KnowledgeBase(BaseModel):
         Returns:
             list[str]: A list of concept names.
         """
-        logger.info("Listing all concept names in the knowledge base.")
-        return [concept.name for concept in self.concepts]
+        logger.debug("Listing all concept names in the knowledge base.")
+        return list(self._by_name)
 
     @classmethod
     def get_tools_prompt(cls) -> str:
@@ -69,48 +128,24 @@ class KnowledgeBase(BaseModel):
 
     @classmethod
     def get_tools(cls, attr_name: str | None = None) -> list[Tool]:
-        """
-        Returns the tools associated with the KnowledgeBase.
-
-        Returns:
-            list[Tool]: A list of tools for interacting with the KnowledgeBase.
-        """
-
-        def add_concept_tool(ctx: RunContext[Any], concept: ConceptInfo) -> None:
-            kb: KnowledgeBase = getattr(ctx.deps, attr_name) if attr_name else ctx.deps
-            if kb is None or not isinstance(kb, cls):
-                raise ValueError("KnowledgeBase dependency is not provided.")
-            kb.add_concept(concept)
-
-        def get_concept_tool(ctx: RunContext[Any], name: str) -> ConceptInfo | None:
-            kb: KnowledgeBase = getattr(ctx.deps, attr_name) if attr_name else ctx.deps
-            if kb is None or not isinstance(kb, cls):
-                raise ValueError("KnowledgeBase dependency is not provided.")
-            return kb.get_concept(name)
-
-        def list_concepts_tool(ctx: RunContext[Any]) -> list[str]:
-            kb: KnowledgeBase = getattr(ctx.deps, attr_name) if attr_name else ctx.deps
-            if kb is None or not isinstance(kb, cls):
-                raise ValueError("KnowledgeBase dependency is not provided.")
-            return kb.list_concepts()
-
-        return [
-            Tool(
-                get_concept_tool,
-                takes_ctx=True,
-                name="KnowledgeBase_get_concept",
-                description="Retrieve a concept by name from the knowledge base.",
-            ),
-            Tool(
-                add_concept_tool,
-                takes_ctx=True,
-                name="KnowledgeBase_add_concept",
-                description="Add a new concept to the knowledge base.",
-            ),
-            Tool(
-                list_concepts_tool,
-                takes_ctx=True,
-                name="KnowledgeBase_list_concepts",
-                description="List all concept names in the knowledge base.",
-            ),
-        ]
+        """Returns the tools associated with the KnowledgeBase."""
+        return build_method_tools(cls, attr_name, _TOOLS)
+
+
+_TOOLS = (
+    (
+        "get_concept",
+        "KnowledgeBase_get_concept",
+        "Retrieve a concept by name from the knowledge base.",
+    ),
+    (
+        "add_concept",
+        "KnowledgeBase_add_concept",
+        "Add a new concept to the knowledge base.",
+    ),
+    (
+        "list_concepts",
+        "KnowledgeBase_list_concepts",
+        "List all concept names in the knowledge base.",
+    ),
+)
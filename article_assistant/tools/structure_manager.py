@@ -2,13 +2,16 @@
 # Created by Renatus Madrigal on 12/26/2025
 #
 
-from typing import Any
+from bisect import bisect_left
+from itertools import islice
 
 from loguru import logger
 from pydantic import BaseModel, Field, PrivateAttr
-from pydantic_ai import RunContext, Tool
+from pydantic_ai import Tool
 
 from article_assistant.types import Outline, OutlineItem, SectionInfo
+from article_assistant.utils.locks import InstanceLock
+from article_assistant.utils.tool_binding import build_method_tools
 
 
 class StructureManager(BaseModel):
@@ -17,7 +20,7 @@ class StructureManager(BaseModel):
     """
 
     outline: Outline = Field(
-        default=Outline(outline_items=[]),
+        default_factory=lambda: Outline(outline_items=[]),
         description="The outline of the article, represented as a list of OutlineItem objects.",
     )
     sections: list[SectionInfo] = Field(
@@ -25,11 +28,19 @@ class StructureManager(BaseModel):
         description="The sections of the article, represented as a list of SectionInfo objects.",
     )
     keywords: list[str] = Field(
-        default=[], description="A list of keywords relevant to the article."
+        default_factory=list,
+        description="A list of keywords relevant to the article.",
     )
     title: str = Field(default="", description="The title of the article.")
 
-    _existed_section_idxs: set[int] = PrivateAttr(default_factory=set)
+    _section_by_idx: dict[int, SectionInfo] = PrivateAttr(default_factory=dict)
+    _sorted_sections: list[SectionInfo] = PrivateAttr(default_factory=list)
+    _sections_key: tuple[int, ...] = PrivateAttr(default=())
+    _md_cache: str | None = PrivateAttr(default=None)
+    _md_key: tuple | None = PrivateAttr(default=None)
+    # Sync tools run in worker threads, so section additions and lazy cache fills
+    # are serialized with this lock.
+    _lock: InstanceLock = PrivateAttr(default_factory=InstanceLock)
 
     def set_outline(self, outline: Outline) -> None:
         """
@@ -58,7 +69,7 @@ class StructureManager(BaseModel):
         Returns:
             OutlineItem: The plan for the specified section.
         """
-        logger.info(f"Retrieving plan for section index: {section_index}")
+        logger.info("Retrieving plan for section index: {}", section_index)
         return self.outline.outline_items[section_index]
 
     def get_context_summary(self, section_index: int) -> str:
@@ -70,11 +81,15 @@ class StructureManager(BaseModel):
         Returns:
             str: A summary of the section's context.
         """
-        summary = "Previous Sections Summary:\n"
-        for sec in self.sections[:section_index]:
-            summary += f"- {sec.heading}: {sec.contents[:100]}...\n"
+        sections = self._ordered_sections()
+        end = bisect_left(sections, section_index, key=lambda s: s.section_index)
+        parts = ["Previous Sections Summary:"]
+        parts.extend(
+            f"- {sec.heading}: {sec.preview}..." for sec in islice(sections, end)
+        )
+        summary = "\n".join(parts) + "\n"
 
-        logger.trace(f"Context summary for section index {section_index}: {summary}")
+        logger.trace("Context summary for section index {}: {}", section_index, summary)
         return summary
 
     def add_section(self, section: SectionInfo) -> None:
@@ -84,14 +99,15 @@ class StructureManager(BaseModel):
         Args:
             section (SectionInfo): The section to add.
         """
-        logger.trace(f"Adding new section: {section}")
-        if section.section_index in self._existed_section_idxs:
-            logger.warning(
-                f"Section with index {section.section_index} already exists. Skipping addition."
-            )
-            return
-        self.sections.append(section)
-        self._existed_section_idxs.add(section.section_index)
+        logger.trace("Adding new section: {}", section)
+        with self._lock:
+            if section.section_index in self._sections_index():
+                logger.warning(
+                    "Section with index {} already exists. Skipping addition.",
+                    section.section_index,
+                )
+                return
+            self.sections.append(section)
 
     def modify_section(self, section_index: int, new_content: str) -> None:
         """
@@ -101,12 +117,11 @@ class StructureManager(BaseModel):
             section_index (int): The index of the section to modify.
             new_content (str): The new content for the section.
         """
-        logger.trace(f"Modifying section index {section_index} with new content.")
-        for section in self.sections:
-            if section.section_index == section_index:
-                section.contents = new_content
-                return
-        raise ValueError(f"Section with index {section_index} not found.")
+        logger.trace("Modifying section index {} with new content.", section_index)
+        try:
+            self._sections_index()[section_index].contents = new_content
+        except KeyError:
+            raise ValueError(f"Section with index {section_index} not found.") from None
 
     def get_section(self, section_index: int) -> SectionInfo:
         """
@@ -117,11 +132,11 @@ class StructureManager(BaseModel):
         Returns:
             SectionInfo: The section with the specified index.
         """
-        logger.info(f"Retrieving section with index: {section_index}")
-        for section in self.sections:
-            if section.section_index == section_index:
-                return section
-        raise ValueError(f"Section with index {section_index} not found.")
+        logger.debug("Retrieving section with index: {}", section_index)
+        try:
+            return self._sections_index()[section_index]
+        except KeyError:
+            raise ValueError(f"Section with index {section_index} not found.") from None
 
     def total_word_count(self) -> int:
         """
@@ -130,25 +145,81 @@ class StructureManager(BaseModel):
         Returns:
             int: The total word count.
         """
-        total_count = 0
-        for section in self.sections:
-            total_count += section.word_count
-        return total_count
+        return sum(section.word_count for section in self.sections)
 
     def to_markdown(self) -> str:
         """
         Converts the article structure to a markdown representation.
+
+        The rendered markdown is cached and reused while the title, keywords and
+        section headings and contents are unchanged, however they were modified.
+
         Returns:
             str: The markdown representation of the article structure.
         """
-        self.sections.sort(key=lambda s: s.section_index)
-        md_content = ""
-        md_content += f"# {self.title}\n\n"
-        md_content += f"Keywords: {', '.join(self.keywords)}\n\n"
-        md_content += "\n\n".join(
-            f"## {section.heading}\n\n{section.contents}" for section in self.sections
+        with self._lock:
+            sections = self._ordered_sections()
+            key = (
+                self.title,
+                tuple(self.keywords),
+                tuple((section.heading, section.contents) for section in sections),
+            )
+            if key != self._md_key:
+                self._md_key = key
+                self._md_cache = "".join(
+                    [
+                        f"# {self.title}\n\n",
+                        f"Keywords: {', '.join(self.keywords)}\n\n",
+                        "\n\n".join(
+                            [
+                                f"## {section.heading}\n\n{section.contents}"
+                                for section in sections
+                            ]
+                        ),
+                    ]
+                )
+            return self._md_cache
+
+    def snapshot(self) -> "StructureManager":
+        """
+        Creates a copy of the article structure that can be modified independently.
+
+        The outline is shared, while the sections and keywords are copied, so
+        changes made through the snapshot never reach this manager.
+
+        Returns:
+            StructureManager: The snapshot of the article structure.
+        """
+        return type(self)(
+            outline=self.outline,
+            sections=[section.model_copy() for section in self.sections],
+            keywords=list(self.keywords),
+            title=self.title,
         )
-        return md_content
+
+    def _ordered_sections(self) -> list[SectionInfo]:
+        with self._lock:
+            self._sync_sections()
+            return self._sorted_sections
+
+    def _sections_index(self) -> dict[int, SectionInfo]:
+        with self._lock:
+            self._sync_sections()
+            return self._section_by_idx
+
+    def _sync_sections(self) -> None:
+        # The sorted copy and the index are keyed on the identities of the listed
+        # sections, so they follow any change to `sections`, including direct
+        # assignment. The sorted copy keeps those sections alive, so their ids
+        # cannot be reused while the key is stored.
+        key = tuple(map(id, self.sections))
+        if key == self._sections_key:
+            return
+        self._sorted_sections = sorted(self.sections, key=lambda s: s.section_index)
+        self._section_by_idx = {}
+        for section in self.sections:
+            self._section_by_idx.setdefault(section.section_index, section)
+        self._sections_key = key
 
     def set_keywords(self, keywords: list[str]) -> None:
         """
@@ -157,7 +228,7 @@ class StructureManager(BaseModel):
         Args:
             keywords (list[str]): The list of keywords to set.
         """
-        logger.info(f"Setting keywords: {keywords}")
+        logger.info("Setting keywords: {}", keywords)
         self.keywords = keywords
 
     def get_keywords(self) -> list[str]:
@@ -177,7 +248,7 @@ class StructureManager(BaseModel):
         Args:
             title (str): The title to set.
         """
-        logger.info(f"Setting title: {title}")
+        logger.info("Setting title: {}", title)
         self.title = title
 
     def get_title(self) -> str:
@@ -205,170 +276,64 @@ class StructureManager(BaseModel):
 
     @classmethod
     def get_tools(cls, attr_name: str | None = None) -> list[Tool]:
-        """
-        Returns the tools associated with the StructureManager.
-
-        Returns:
-            list[Tool]: A list of tools for interacting with the StructureManager.
-        """
-
-        def set_outline_tool(ctx: RunContext[Any], outline: Outline) -> None:
-            sm: StructureManager = (
-                getattr(ctx.deps, attr_name) if attr_name else ctx.deps
-            )
-            if sm is None or not isinstance(sm, cls):
-                raise ValueError("StructureManager dependency is not provided.")
-            sm.set_outline(outline)
-
-        def list_outline_items_tool(ctx: RunContext[Any]) -> list[OutlineItem]:
-            sm: StructureManager = (
-                getattr(ctx.deps, attr_name) if attr_name else ctx.deps
-            )
-            if sm is None or not isinstance(sm, cls):
-                raise ValueError("StructureManager dependency is not provided.")
-            return sm.list_outline_items()
-
-        def get_section_plan_tool(
-            ctx: RunContext[Any], section_index: int
-        ) -> OutlineItem:
-            sm: StructureManager = (
-                getattr(ctx.deps, attr_name) if attr_name else ctx.deps
-            )
-            if sm is None or not isinstance(sm, cls):
-                raise ValueError("StructureManager dependency is not provided.")
-            return sm.get_section_plan(section_index)
-
-        def get_context_summary_tool(ctx: RunContext[Any], section_index: int) -> str:
-            sm: StructureManager = (
-                getattr(ctx.deps, attr_name) if attr_name else ctx.deps
-            )
-            if sm is None or not isinstance(sm, cls):
-                raise ValueError("StructureManager dependency is not provided.")
-            return sm.get_context_summary(section_index)
-
-        def add_section_tool(ctx: RunContext[Any], section: SectionInfo) -> None:
-            sm: StructureManager = (
-                getattr(ctx.deps, attr_name) if attr_name else ctx.deps
-            )
-            if sm is None or not isinstance(sm, cls):
-                raise ValueError("StructureManager dependency is not provided.")
-            sm.add_section(section)
-
-        def modify_section_tool(
-            ctx: RunContext[Any], section_index: int, new_content: str
-        ) -> None:
-            sm: StructureManager = (
-                getattr(ctx.deps, attr_name) if attr_name else ctx.deps
-            )
-            if sm is None or not isinstance(sm, cls):
-                raise ValueError("StructureManager dependency is not provided.")
-            sm.modify_section(section_index, new_content)
-
-        def get_section_tool(ctx: RunContext[Any], section_index: int) -> SectionInfo:
-            sm: StructureManager = (
-                getattr(ctx.deps, attr_name) if attr_name else ctx.deps
-            )
-            if sm is None or not isinstance(sm, cls):
-                raise ValueError("StructureManager dependency is not provided.")
-            return sm.get_section(section_index)
-
-        def set_title_tool(ctx: RunContext[Any], title: str) -> None:
-            sm: StructureManager = (
-                getattr(ctx.deps, attr_name) if attr_name else ctx.deps
-            )
-            if sm is None or not isinstance(sm, cls):
-                raise ValueError("StructureManager dependency is not provided.")
-            sm.set_title(title)
-
-        def get_title_tool(ctx: RunContext[Any]) -> str:
-            sm: StructureManager = (
-                getattr(ctx.deps, attr_name) if attr_name else ctx.deps
-            )
-            if sm is None or not isinstance(sm, cls):
-                raise ValueError("StructureManager dependency is not provided.")
-            return sm.get_title()
-
-        def set_keywords_tool(ctx: RunContext[Any], keywords: list[str]) -> None:
-            sm: StructureManager = (
-                getattr(ctx.deps, attr_name) if attr_name else ctx.deps
-            )
-            if sm is None or not isinstance(sm, cls):
-                raise ValueError("StructureManager dependency is not provided.")
-            sm.set_keywords(keywords)
-
-        def get_keywords_tool(ctx: RunContext[Any]) -> list[str]:
-            sm: StructureManager = (
-                getattr(ctx.deps, attr_name) if attr_name else ctx.deps
-            )
-            if sm is None or not isinstance(sm, cls):
-                raise ValueError("StructureManager dependency is not provided.")
-            return sm.get_keywords()
-
-        return [
-            Tool(
-                set_outline_tool,
-                takes_ctx=True,
-                name="StructureManager_set_outline",
-                description="Sets the article outline.",
-            ),
-            Tool(
-                list_outline_items_tool,
-                takes_ctx=True,
-                name="StructureManager_list_outline_items",
-                description="Lists all outline items in the article outline.",
-            ),
-            Tool(
-                get_section_plan_tool,
-                takes_ctx=True,
-                name="StructureManager_get_section_plan",
-                description="Retrieves the plan for a specific section based on its index.",
-            ),
-            Tool(
-                get_context_summary_tool,
-                takes_ctx=True,
-                name="StructureManager_get_context_summary",
-                description="Generates a summary of the context for a specific section.",
-            ),
-            Tool(
-                add_section_tool,
-                takes_ctx=True,
-                name="StructureManager_add_section",
-                description="Adds a new section to the article structure.",
-            ),
-            Tool(
-                modify_section_tool,
-                takes_ctx=True,
-                name="StructureManager_modify_section",
-                description="Modifies the content of an existing section.",
-            ),
-            Tool(
-                get_section_tool,
-                takes_ctx=True,
-                name="StructureManager_get_section",
-                description="Retrieves a section by its index.",
-            ),
-            Tool(
-                set_title_tool,
-                takes_ctx=True,
-                name="StructureManager_set_title",
-                description="Sets the title of the article.",
-            ),
-            Tool(
-                get_title_tool,
-                takes_ctx=True,
-                name="StructureManager_get_title",
-                description="Retrieves the title of the article.",
-            ),
-            Tool(
-                set_keywords_tool,
-                takes_ctx=True,
-                name="StructureManager_set_keywords",
-                description="Sets the keywords of the article.",
-            ),
-            Tool(
-                get_keywords_tool,
-                takes_ctx=True,
-                name="StructureManager_get_keywords",
-                description="Retrieves the keywords of the article.",
-            ),
-        ]
+        """Returns the tools associated with the StructureManager."""
+        return build_method_tools(cls, attr_name, _TOOLS)
+
+
+_TOOLS = (
+    (
+        "set_outline",
+        "StructureManager_set_outline",
+        "Sets the article outline.",
+    ),
+    (
+        "list_outline_items",
+        "StructureManager_list_outline_items",
+        "Lists all outline items in the article outline.",
+    ),
+    (
+        "get_section_plan",
+        "StructureManager_get_section_plan",
+        "Retrieves the plan for a specific section based on its index.",
+    ),
+    (
+        "get_context_summary",
+        "StructureManager_get_context_summary",
+        "Generates a summary of the context for a specific section.",
+    ),
+    (
+        "add_section",
+        "StructureManager_add_section",
+        "Adds a new section to the article structure.",
+    ),
+    (
+        "modify_section",
+        "StructureManager_modify_section",
+        "Modifies the content of an existing section.",
+    ),
+    (
+        "get_section",
+        "StructureManager_get_section",
+        "Retrieves a section by its index.",
+    ),
+    (
+        "set_title",
+        "StructureManager_set_title",
+        "Sets the title of the article.",
+    ),
+    (
+        "get_title",
+        "StructureManager_get_title",
+        "Retrieves the title of the article.",
+    ),
+    (
+        "set_keywords",
+        "StructureManager_set_keywords",
+        "Sets the keywords of the article.",
+    ),
+    (
+        "get_keywords",
+        "StructureManager_get_keywords",
+        "Retrieves the keywords of the article.",
+    ),
+)
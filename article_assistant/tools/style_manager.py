@@ -2,23 +2,28 @@
 # Created by Renatus Madrigal on 12/26/2025
 #
 
-from typing import Any
+from dataclasses import dataclass, field
 
-from pydantic import BaseModel, Field
-from pydantic_ai import RunContext, Tool
+from pydantic_ai import Tool
 from loguru import logger
 
 from article_assistant.types import StyleGuide
+from article_assistant.utils.tool_binding import build_method_tools
 
 
-class StyleManager(BaseModel):
+@dataclass(slots=True)
+class StyleManager:
     """
     Manages the style of articles within the Article Assistant application.
+
+    Attributes:
+        style_guide (StyleGuide): The style guide for the article.
     """
 
-    style_guide: StyleGuide = Field(
-        default=StyleGuide(),
-        description="The style guide for the article, represented as a StyleGuide object.",
+    style_guide: StyleGuide = field(default_factory=StyleGuide.model_construct)
+    # The prompt together with the style guide it was built from.
+    _prompt_cache: tuple[StyleGuide, str] | None = field(
+        default=None, init=False, repr=False, compare=False
     )
 
     def set_style_guide(self, style_guide: StyleGuide) -> None:
@@ -28,7 +33,7 @@ class StyleManager(BaseModel):
         Args:
             style_guide (StyleGuide): The style guide to set.
         """
-        logger.trace(f"Setting new style guide: {style_guide}")
+        logger.trace("Setting new style guide: {}", style_guide)
         self.style_guide = style_guide
 
     def get_style_guide(self) -> StyleGuide:
@@ -45,52 +50,42 @@ class StyleManager(BaseModel):
         """
         Converts the style guide to a prompt string.
 
+        The prompt is cached until the style guide is replaced, however it was
+        replaced.
+
         Returns:
             str: The style guide represented as a prompt string.
         """
         sg = self.style_guide
-        prompt_parts = [
-            f"Main Language: {sg.main_language}",
-            f"Tone: {sg.tone}",
-            f"Voice: {sg.voice}",
-            f"Target Audience: {sg.target_audience}",
-        ]
+        cache = self._prompt_cache
+        if cache is not None and cache[0] is sg:
+            return cache[1]
+        prompt = (
+            f"Main Language: {sg.main_language}\n"
+            f"Tone: {sg.tone}\n"
+            f"Voice: {sg.voice}\n"
+            f"Target Audience: {sg.target_audience}"
+        )
         if sg.formatting_preferences:
-            prompt_parts.append(f"Formatting Preferences: {sg.formatting_preferences}")
-        return "\n".join(prompt_parts)
+            prompt += f"\nFormatting Preferences: {sg.formatting_preferences}"
+        self._prompt_cache = (sg, prompt)
+        return prompt
 
     @classmethod
     def get_tools(cls, attr_name: str | None = None) -> list[Tool]:
-        """
-        Returns the tools associated with the StyleManager.
-
-        Returns:
-            list[Tool]: A list of tools for interacting with the StyleManager.
-        """
-
-        def set_style_guide_tool(ctx: RunContext[Any], style_guide: StyleGuide) -> None:
-            sm: StyleManager = getattr(ctx.deps, attr_name) if attr_name else ctx.deps
-            if sm is None or not isinstance(sm, cls):
-                raise ValueError("StyleManager dependency is not provided.")
-            sm.set_style_guide(style_guide)
-
-        def get_style_guide_tool(ctx: RunContext[Any]) -> StyleGuide:
-            sm: StyleManager = getattr(ctx.deps, attr_name) if attr_name else ctx.deps
-            if sm is None or not isinstance(sm, cls):
-                raise ValueError("StyleManager dependency is not provided.")
-            return sm.get_style_guide()
-
-        return [
-            Tool(
-                set_style_guide_tool,
-                takes_ctx=True,
-                name="set_style_guide",
-                description="Sets the article style guide.",
-            ),
-            Tool(
-                get_style_guide_tool,
-                takes_ctx=True,
-                name="get_style_guide",
-                description="Retrieves the current article style guide.",
-            ),
-        ]
+        """Returns the tools associated with the StyleManager."""
+        return build_method_tools(cls, attr_name, _TOOLS)
+
+
+_TOOLS = (
+    (
+        "set_style_guide",
+        "set_style_guide",
+        "Sets the article style guide.",
+    ),
+    (
+        "get_style_guide",
+        "get_style_guide",
+        "Retrieves the current article style guide.",
+    ),
+)
@@ -2,15 +2,20 @@
 # Created by Renatus Madrigal on 12/26/2025
 #
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 import re
 
+# CJK Unified Ideographs, each counted as a word of its own.
+_CJK_RE = re.compile(r"[\u4e00-\u9fff]")
+
 
 class OutlineItem(BaseModel):
     """
     Represents a single item in the article outline.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     title: str = Field(..., description="The title of the outline item.")
     purpose: str = Field(
         ...,
@@ -45,6 +50,8 @@ class StyleGuide(BaseModel):
     Represents the style guide for articles.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     main_language: str = Field(
         default="English",
         description="The main language of the article (e.g., English, Simplified Chinese).",
@@ -85,16 +92,41 @@ class SectionInfo(BaseModel):
         description="A brief summary of the section.",
     )
 
+    _preview: str | None = PrivateAttr(default=None)
+    _word_count: int | None = PrivateAttr(default=None)
+    _cached_contents: str | None = PrivateAttr(default=None)
+
+    def _refresh_derived(self) -> None:
+        # Drops the derived values once `contents` is no longer the string they were
+        # computed from, however it was replaced.
+        if self._cached_contents is not self.contents:
+            self._cached_contents = self.contents
+            self._preview = None
+            self._word_count = None
+
+    @property
+    def preview(self) -> str:
+        """
+        The first 100 characters of the section contents, computed once.
+        """
+        self._refresh_derived()
+        if self._preview is None:
+            self._preview = self.contents[:100]
+        return self._preview
+
     @property
     def word_count(self) -> int:
         """
-        Calculates the word count of the section contents.
+        Calculates the word count of the section contents, computed once.
         """
-        # Split on whitespace for regular words
-        words = self.contents.split()
-        # Count Chinese characters (CJK Unified Ideographs) as individual words
-        chinese_chars = re.findall(r"[\u4e00-\u9fff]", self.contents)
-        return len(words) + len(chinese_chars)
+        self._refresh_derived()
+        if self._word_count is None:
+            # Split on whitespace for regular words
+            words = self.contents.split()
+            # Count Chinese characters (CJK Unified Ideographs) as individual words
+            chinese_chars = _CJK_RE.findall(self.contents)
+            self._word_count = len(words) + len(chinese_chars)
+        return self._word_count
 
 
 class ConceptInfo(BaseModel):
@@ -102,6 +134,8 @@ class ConceptInfo(BaseModel):
     Represents information about a specific concept related to the article.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(..., description="The name of the concept.")
     definition: str = Field(..., description="The definition of the concept.")
     relevance: str = Field(
@@ -0,0 +1,32 @@
+#
+# Created by Renatus Madrigal on 10/15/2026
+#
+
+import threading
+from typing import Any
+
+
+class InstanceLock:
+    """
+    A re-entrant lock owned by a single object.
+
+    Deep copies and unpickled copies of the owner get a fresh, unlocked lock
+    instead of failing on the underlying `threading.RLock`.
+    """
+
+    __slots__ = ("_lock",)
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+
+    def __enter__(self) -> bool:
+        return self._lock.__enter__()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._lock.__exit__(*exc_info)
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> "InstanceLock":
+        return InstanceLock()
+
+    def __reduce__(self) -> tuple[type["InstanceLock"], tuple[()]]:
+        return InstanceLock, ()
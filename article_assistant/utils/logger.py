@@ -2,6 +2,7 @@
 # Created by Renatus Madrigal on 12/28/2025
 #
 
+import inspect
 import os
 import sys
 from typing import Callable, Optional
@@ -10,6 +11,8 @@ from loguru import logger
 
 from mcp.types import LoggingMessageNotificationParams
 
+_caller_depth: dict[tuple[str, int], int] = {}
+
 
 class InterceptHandler(logging.Handler):
     def emit(self, record: logging.LogRecord) -> None:
@@ -19,11 +22,18 @@ class InterceptHandler(logging.Handler):
         except ValueError:
             level = record.levelno
 
-        # Find caller from where the logging call was made
-        frame, depth = logging.currentframe(), 2
-        while frame.f_code.co_filename == logging.__file__:  # type: ignore[union-attr]
-            frame = frame.f_back  # type: ignore[union-attr]
-            depth += 1
+        # Find caller from where the logging call was made. A call site always goes
+        # through the same logging frames, so the depth is only computed once per site.
+        key = (record.pathname, record.lineno)
+        depth = _caller_depth.get(key)
+        if depth is None:
+            frame, depth = inspect.currentframe(), 0
+            while frame and (
+                depth == 0 or frame.f_code.co_filename == logging.__file__
+            ):
+                frame = frame.f_back
+                depth += 1
+            _caller_depth[key] = depth
 
         logger.opt(depth=depth, exception=record.exc_info).log(
             level, record.getMessage()
@@ -34,6 +44,9 @@ def setup_logger(log_level: Optional[str] = None, redirect_std: bool = False) ->
     """
     Sets up the logger with the specified log level.
 
+    Messages are written to stderr from a background thread. Await
+    `logger.complete()` before exiting to flush pending messages.
+
     Args:
         log_level (str): The logging level (e.g., "DEBUG", "INFO", "WARNING", "ERROR").
     """
@@ -49,6 +62,7 @@ def setup_logger(log_level: Optional[str] = None, redirect_std: bool = False) ->
         "<level>{level: <8}</level> | "
         "<cyan>{module}</cyan>:<cyan>{line}</cyan> - "
         "<level>{message}</level>",
+        enqueue=True,
     )
 
     if redirect_std:
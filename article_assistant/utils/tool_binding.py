@@ -0,0 +1,116 @@
+#
+# Created by Renatus Madrigal on 10/15/2026
+#
+
+import inspect
+from collections.abc import Iterable
+from dataclasses import replace
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any
+
+from pydantic_ai import RunContext, Tool
+
+
+def bind_method_tool(
+    cls: type,
+    method_name: str,
+    attr_name: str | None,
+    name: str,
+    description: str,
+) -> Tool:
+    """
+    Exposes a method of a dependency object as a pydantic-ai tool.
+
+    The dependency is looked up on `ctx.deps` through `attr_name` (or is `ctx.deps`
+    itself when `attr_name` is None), and the method's own signature is published
+    as the tool signature so the JSON schema matches the method parameters.
+    Coroutine methods produce async tools, which pydantic-ai runs on the event loop
+    instead of a worker thread. The dependency type is only checked when assertions
+    are enabled.
+
+    Args:
+        cls (type): The class that defines the method.
+        method_name (str): The name of the method to expose.
+        attr_name (str | None): The attribute of the deps holding the instance.
+        name (str): The name of the tool.
+        description (str): The description of the tool.
+    Returns:
+        Tool: A tool that takes the run context and calls the bound method.
+    """
+    method = getattr(cls, method_name)
+    resolve = attrgetter(attr_name) if attr_name else lambda deps: deps
+
+    if inspect.iscoroutinefunction(method):
+
+        async def tool(ctx: RunContext[Any], *args, **kwargs):
+            instance = resolve(ctx.deps)
+            assert isinstance(
+                instance, cls
+            ), f"{cls.__name__} dependency is not provided."
+            return await method(instance, *args, **kwargs)
+
+    else:
+
+        def tool(ctx: RunContext[Any], *args, **kwargs):
+            instance = resolve(ctx.deps)
+            assert isinstance(
+                instance, cls
+            ), f"{cls.__name__} dependency is not provided."
+            return method(instance, *args, **kwargs)
+
+    signature = inspect.signature(method)
+    ctx_param = inspect.Parameter(
+        "ctx", inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=RunContext[Any]
+    )
+    tool.__signature__ = signature.replace(
+        parameters=[ctx_param, *list(signature.parameters.values())[1:]]
+    )
+    tool.__annotations__ = {"ctx": RunContext[Any], **method.__annotations__}
+    tool.__name__ = tool.__qualname__ = f"{method_name}_tool"
+
+    return Tool(tool, takes_ctx=True, name=name, description=description)
+
+
+def build_method_tools(
+    cls: type, attr_name: str | None, table: tuple[tuple[str, str, str], ...]
+) -> list[Tool]:
+    """
+    Exposes the methods listed in a tool table as pydantic-ai tools.
+
+    The tools are built once per (class, attr_name, table) and returned as copies.
+
+    Args:
+        cls (type): The class that defines the methods.
+        attr_name (str | None): The attribute of the deps holding the instance.
+        table (tuple[tuple[str, str, str], ...]): The (method name, tool name,
+            description) entries of the tools to build.
+    Returns:
+        list[Tool]: The tools, in table order.
+    """
+    return copy_tools(_build_method_tools(cls, attr_name, table))
+
+
+def copy_tools(tools: Iterable[Tool]) -> list[Tool]:
+    """
+    Makes shallow copies of shared tools before handing them to an agent.
+
+    Agents set per-agent options such as `max_retries` on the tools they are given,
+    so cached tools must not be passed to them directly.
+
+    Args:
+        tools (Iterable[Tool]): The tools to copy.
+    Returns:
+        list[Tool]: The copied tools.
+    """
+    return [replace(tool) for tool in tools]
+
+
+@lru_cache(maxsize=None)
+def _build_method_tools(
+    cls: type, attr_name: str | None, table: tuple[tuple[str, str, str], ...]
+) -> tuple[Tool, ...]:
+    return tuple(
+        bind_method_tool(cls, method_name, attr_name, name, description)
+        for method_name, name, description in table
+    )
@@ -2,6 +2,7 @@
 # Created by Renatus Madrigal on 12/28/2025
 #
 
+import asyncio
 from typing import Sequence
 
 from loguru import logger
@@ -10,7 +11,11 @@ from pydantic_ai.models import Model
 
 from article_assistant.agents.architect import ArchitectDeps, create_architect_agent
 from article_assistant.agents.reviewer import ReviewerDeps, create_reviewer_agent
-from article_assistant.agents.scriber import ScriberDeps, create_scriber_agent
+from article_assistant.agents.scriber import (
+    ScriberDeps,
+    create_scriber_agent,
+    run_scriber_batch,
+)
 from article_assistant.agents.stylist import create_stylist_agent
 from article_assistant.tools import (
     KnowledgeBase,
@@ -36,20 +41,6 @@ async def generate_article_workflow(
         additional_tools=get_base_tools(),
         toolsets=toolsets,
     )
-
-    outline = await architect_agent.run(
-        f"Create a detailed outline for an article about {topic}. 3 sections apart from introduction and conclusion in total.",
-        deps=ArchitectDeps(structure_manager=structure_manager),
-    )
-
-    logger.info("Outline created by Architect Agent.")
-    logger.debug(f"Outline Output: {outline.output}")
-
-    structure_manager.set_outline(outline.output)
-
-    section_count = len(structure_manager.outline.outline_items)
-    logger.info(f"Outline contains {section_count} items.")
-
     stylist = create_stylist_agent(
         model,
         additional_tools=get_base_tools(),
@@ -57,15 +48,30 @@ async def generate_article_workflow(
         toolsets=toolsets,
     )
 
-    style_result = await stylist.run(
-        (
-            f"Create a style guide for an article about {topic}. "
-            f"The target audience is {target_audience}."
+    # The outline and the style guide do not depend on each other.
+    outline, style_result = await asyncio.gather(
+        architect_agent.run(
+            f"Create a detailed outline for an article about {topic}. 3 sections apart from introduction and conclusion in total.",
+            deps=ArchitectDeps(structure_manager=structure_manager),
+        ),
+        stylist.run(
+            (
+                f"Create a style guide for an article about {topic}. "
+                f"The target audience is {target_audience}."
+            ),
         ),
     )
 
+    logger.info("Outline created by Architect Agent.")
+    logger.debug("Outline Output: {}", outline.output)
+
+    structure_manager.set_outline(outline.output)
+
+    section_count = len(structure_manager.outline.outline_items)
+    logger.info("Outline contains {} items.", section_count)
+
     logger.info("Style guide created by Stylist Agent.")
-    logger.debug(f"Style Guide Output: {style_result.output}")
+    logger.debug("Style Guide Output: {}", style_result.output)
 
     style_manager = StyleManager(style_guide=style_result.output)
 
@@ -80,35 +86,21 @@ async def generate_article_workflow(
         toolsets=toolsets,
     )
 
-    for idx, outline_item in enumerate(structure_manager.outline.outline_items[1:-1]):
-        prompt = (
-            f"Write a detailed section for the outline item titled '{outline_item.title}'. "
-            f"Use the purpose '{outline_item.purpose}' to guide the content. "
-            f"Refer to the style guide and knowledge base as needed. "
-            f"Ensure the content is in {target_language}."
-        )
-        section_result = await scriber_agent.run(
-            prompt,
-            deps=scriber_deps,
-        )
-        structure_manager.add_section(section_result.output)
-        logger.info(f"Section {idx + 1}/{section_count} written by Scriber Agent.")
-
-    # Generate introduction and conclusion sections
-    for special_item_idx in [0, -1]:
-        special_item = structure_manager.outline.outline_items[special_item_idx]
-        prompt = (
-            f"Write a detailed section for the outline item titled '{special_item.title}'. "
-            f"Use the purpose '{special_item.purpose}' to guide the content. "
-            f"Refer to the style guide and knowledge base as needed. "
-            f"Ensure the content is in {target_language}."
-        )
-        section_result = await scriber_agent.run(
-            prompt,
-            deps=scriber_deps,
+    # Sections are written concurrently and added in outline order afterwards.
+    sections = await run_scriber_batch(
+        scriber_agent,
+        scriber_deps,
+        list(range(section_count)),
+        target_language=target_language,
+    )
+    for section in sections:
+        structure_manager.add_section(section)
+        logger.info(
+            "Section {}/{} '{}' written by Scriber Agent.",
+            section.section_index + 1,
+            section_count,
+            section.heading,
         )
-        structure_manager.add_section(section_result.output)
-        logger.info(f"Section '{special_item.title}' written by Scriber Agent.")
 
     logger.info("Reviewing the entire article with Reviewer Agent.")
 
@@ -131,7 +123,7 @@ async def generate_article_workflow(
     )
 
     logger.info("Article reviewed by Reviewer Agent.")
-    logger.debug(f"Review Output: {review_result.output}")
+    logger.debug("Review Output: {}", review_result.output)
 
     print("\n--- Final Article Sections ---\n")
 
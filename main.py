@@ -1,59 +1,47 @@
 import asyncio
-from collections.abc import AsyncIterable
-from datetime import date
+from functools import lru_cache
 
 import yaml
 from loguru import logger
-from pydantic_ai import (
-    Agent,
-    AgentStreamEvent,
-    FinalResultEvent,
-    FunctionToolCallEvent,
-    FunctionToolResultEvent,
-    PartDeltaEvent,
-    PartStartEvent,
-    RunContext,
-    TextPart,
-    TextPartDelta,
-    ThinkingPart,
-    ThinkingPartDelta,
-    ToolCallPart,
-    ToolCallPartDelta,
-)
 from pydantic_ai.models.openai import OpenAIChatModel
 from pydantic_ai.providers.openai import OpenAIProvider
 from pydantic_ai.mcp import MCPServerStdio
-from mcp.types import LoggingMessageNotificationParams
-
-from article_assistant.agents import (
-    ArchitectDeps,
-    ScriberDeps,
-    create_architect_agent,
-    create_scriber_agent,
-    create_stylist_agent,
-)
+
+from article_assistant.agents.model_client import create_http_client
 from article_assistant.config import Config
-from article_assistant.tools import (
-    KnowledgeBase,
-    StructureManager,
-    StyleManager,
-    get_base_tools,
-)
 from article_assistant.utils.logger import (
     setup_logger,
-    InterceptHandler,
     get_mcp_logger,
 )
 
 from article_assistant.workflows.generate_article import generate_article_workflow
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
+
+@lru_cache(maxsize=1)
+def _load_config(path: str) -> Config:
+    with open(path, "r") as file:
+        config_dict = yaml.load(file, Loader=_YamlLoader)
+    return Config.model_validate(config_dict)
+
+
+@lru_cache(maxsize=4)
+def _build_model(model_name: str, api_key: str, base_url: str) -> OpenAIChatModel:
+    return OpenAIChatModel(
+        model_name,
+        provider=OpenAIProvider(
+            api_key=api_key, base_url=base_url, http_client=create_http_client()
+        ),
+    )
+
 
 async def main2():
-    config_file = "config.yaml"
-    with open(config_file, "r") as file:
-        config_dict = yaml.safe_load(file)
-    config = Config(**config_dict)
-    logger.info(f"Loaded config: {config}")
+    config = _load_config("config.yaml")
+    logger.info("Loaded config: {}", config)
 
     ddg_mcp = MCPServerStdio(
         "uvx",
@@ -62,11 +50,10 @@ async def main2():
         log_handler=get_mcp_logger(prefix="[DDG MCP] "),
     )
 
-    model = OpenAIChatModel(
+    model = _build_model(
         config.llm.model_name,
-        provider=OpenAIProvider(
-            api_key=config.llm.api_key, base_url=config.llm.base_url
-        ),
+        config.llm.api_key.get_secret_value(),
+        config.llm.base_url,
     )
 
     article = await generate_article_workflow(
@@ -83,6 +70,8 @@ async def main2():
     with open("output.md", "w", encoding="utf-8") as f:
         f.write(article)
 
+    await logger.complete()
+
 
 if __name__ == "__main__":
     setup_logger("TRACE")